@@ -8,6 +8,9 @@ Collects and consolidates daily Fear & Greed index data for stocks and cryptocur
 import requests
 import pandas as pd
 import os
+import io
+import json
+import math
 from datetime import datetime, timedelta
 import time
 import yfinance as yf
@@ -31,12 +34,17 @@ class DataCollector:
         self.vix_csv = os.path.join(self.data_dir, "vix_index.csv")
         self.btc_premium_csv = os.path.join(self.data_dir, "btc_premium.csv")
         self.gold_csv = os.path.join("docs", "data", "gold.csv")
+        self.changes_log = os.path.join(self.data_dir, "changes.jsonl")
 
         self.daily_mode = daily_mode
+        self.run_id = datetime.now().isoformat(timespec='seconds')
+        self.change_count = 0
 
         os.makedirs(self.data_dir, exist_ok=True)
         os.makedirs(os.path.join("docs", "data"), exist_ok=True)
 
+        self._seq = None
+
     # ── yfinance ──────────────────────────────────────────────────────────────
 
     def _fetch_yfinance_data(self, ticker, start, end):
@@ -189,12 +197,122 @@ class DataCollector:
             existing['date'] = pd.to_datetime(existing['date']).dt.date
             combined = pd.concat([existing, df]).drop_duplicates('date', keep='last')
             combined = combined.sort_values('date').reset_index(drop=True)
-            combined.to_csv(self.vix_csv, index=False)
+            self._save_csv(combined, self.vix_csv)
         else:
             df = df.sort_values('date').reset_index(drop=True)
-            df.to_csv(self.vix_csv, index=False)
+            self._save_csv(df, self.vix_csv)
         print(f"VIX saved: {self.vix_csv}")
 
+    # ── Change Feed ───────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _read_rows(source, date_col='date'):
+        """Read a CSV as {date: {column: raw string}} keyed on date_col."""
+        df = pd.read_csv(source, dtype=str, keep_default_na=False)
+        if date_col not in df.columns:
+            raise ValueError(f"Key column '{date_col}' not found in {list(df.columns)}")
+        return {row[date_col]: row for row in df.to_dict('records')}
+
+    @staticmethod
+    def _parse_value(value):
+        if value == '':
+            return None
+        for cast in (int, float):
+            try:
+                value = cast(value)
+                break
+            except ValueError:
+                continue
+        if isinstance(value, float) and not math.isfinite(value):
+            return None
+        return value
+
+    def _load_last_seq(self):
+        """Return the last sequence number in the change log, repairing an interrupted final append.
+
+        Only the final line may be damaged: an unparsable last line is dropped and a complete
+        last record missing its newline gets one. An invalid line anywhere else raises.
+        """
+        if not os.path.exists(self.changes_log):
+            return 0
+        with open(self.changes_log, 'rb') as f:
+            lines = f.read().splitlines(keepends=True)
+        while lines and not lines[-1].strip():
+            lines.pop()
+
+        last_seq = 0
+        for lineno, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                last_seq = json.loads(line)['seq']
+            except (ValueError, KeyError, TypeError):
+                if lineno < len(lines):
+                    raise ValueError(f"{self.changes_log}:{lineno} is not a valid change record; fix the log by hand")
+                valid_bytes = sum(len(l) for l in lines[:-1])
+                print(f"Warning: dropping incomplete last line of {self.changes_log}")
+                with open(self.changes_log, 'r+b') as f:
+                    f.truncate(valid_bytes)
+                return last_seq
+
+        if lines and not lines[-1].endswith(b'\n'):
+            with open(self.changes_log, 'ab') as f:
+                f.write(b'\n')
+        return last_seq
+
+    def _diff_rows(self, new_df, output_path, date_col='date'):
+        """Return inserted/updated/deleted rows of new_df relative to output_path on disk."""
+        new_rows = self._read_rows(io.StringIO(new_df.to_csv(index=False)), date_col)
+        old_rows = {}
+        if os.path.exists(output_path):
+            try:
+                old_rows = self._read_rows(output_path, date_col)
+            except (ValueError, pd.errors.EmptyDataError) as e:
+                print(f"Warning: could not read existing {output_path} for change log ({e}); treating all rows as inserts.")
+        series = os.path.splitext(os.path.basename(output_path))[0]
+
+        def values(row):
+            return {k: self._parse_value(v) for k, v in row.items() if k != date_col} if row else None
+
+        entries = []
+        for date in sorted(set(old_rows) | set(new_rows)):
+            # Compare parsed values so formatting differences such as 30 vs 30.0 are not updates.
+            old, new = values(old_rows.get(date)), values(new_rows.get(date))
+            if old == new:
+                continue
+            op = 'insert' if old is None else 'delete' if new is None else 'update'
+            entries.append({
+                'run_id': self.run_id,
+                'series': series,
+                'op': op,
+                'date': date,
+                'old': old,
+                'new': new,
+            })
+        return entries
+
+    def _append_changes(self, entries):
+        """Append diff entries to the change log with consecutive sequence numbers."""
+        if not entries:
+            return
+        if self._seq is None:
+            self._seq = self._load_last_seq()
+        lines = []
+        for offset, entry in enumerate(entries, start=1):
+            record = {'seq': self._seq + offset, **entry}
+            lines.append(json.dumps(record, ensure_ascii=False, allow_nan=False) + '\n')
+        with open(self.changes_log, 'a', encoding='utf-8') as f:
+            f.writelines(lines)
+        self._seq += len(entries)
+        self.change_count += len(entries)
+        print(f"{entries[0]['series']}: {len(entries)} row change(s) logged to {self.changes_log}")
+
+    def _save_csv(self, df, output_path, date_col='date'):
+        # Diff first, but only log once the CSV is on disk so the feed never gets ahead of the data.
+        entries = self._diff_rows(df, output_path, date_col)
+        df.to_csv(output_path, index=False)
+        self._append_changes(entries)
+
     # ── Merge & Save ──────────────────────────────────────────────────────────
 
     def _merge_and_save(self, df_list, output_path, date_col='date'):
@@ -219,10 +337,10 @@ class DataCollector:
                 .sort_values(by=date_col)
                 .reset_index(drop=True)
             )
-            combined_df.to_csv(output_path, index=False)
+            self._save_csv(combined_df, output_path, date_col)
             print(f"Updated {output_path} with today's data.")
         else:
-            merged_df.to_csv(output_path, index=False)
+            self._save_csv(merged_df, output_path, date_col)
             print(f"Saved {output_path}")
 
     # ── Stock Collection ──────────────────────────────────────────────────────
@@ -317,9 +435,9 @@ class DataCollector:
                     .sort_values('date')
                     .reset_index(drop=True)
                 )
-                combined.to_csv(self.btc_premium_csv, index=False)
+                self._save_csv(combined, self.btc_premium_csv)
             else:
-                new_row.to_csv(self.btc_premium_csv, index=False)
+                self._save_csv(new_row, self.btc_premium_csv)
 
             print(f"BTC premium: {round(premium, 2)}% (Upbit: {upbit_price:,.0f} KRW, Binance: ${binance_price:,.2f})")
         except Exception as e:
@@ -357,8 +475,9 @@ class DataCollector:
                 merged['upbit_price_krw'] / (merged['binance_price_usd'] * merged['usd_krw_rate']) - 1
             ) * 100
             merged['premium_percent'] = merged['premium_percent'].round(2)
-            merged[['date', 'upbit_price_krw', 'binance_price_usd', 'usd_krw_rate', 'premium_percent']].to_csv(
-                self.btc_premium_csv, index=False
+            self._save_csv(
+                merged[['date', 'upbit_price_krw', 'binance_price_usd', 'usd_krw_rate', 'premium_percent']],
+                self.btc_premium_csv,
             )
             print(f"Historical BTC premium saved: {len(merged)} rows")
         except Exception as e:
@@ -523,3 +642,4 @@ if __name__ == "__main__":
     daily_mode = len(sys.argv) > 1 and sys.argv[1] == "--daily"
     collector = DataCollector(daily_mode=daily_mode)
     collector.collect_all()
+    print(f"Run {collector.run_id}: {collector.change_count} row change(s) recorded.")
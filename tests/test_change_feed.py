@@ -0,0 +1,110 @@
+import json
+import os
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from data_collector import DataCollector
+
+
+@pytest.fixture
+def collector(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return DataCollector()
+
+
+def read_log(collector):
+    with open(collector.changes_log, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def frame(rows):
+    return pd.DataFrame([{'date': d, 'value': v} for d, v in rows])
+
+
+def test_detects_insert_update_and_delete(collector):
+    path = os.path.join(collector.data_dir, 'series.csv')
+    collector._save_csv(frame([(date(2024, 1, 1), 1.5), (date(2024, 1, 2), 2)]), path)
+    collector._save_csv(frame([(date(2024, 1, 2), 2.5), (date(2024, 1, 3), 3)]), path)
+
+    entries = read_log(collector)
+    assert [(e['op'], e['date']) for e in entries] == [
+        ('insert', '2024-01-01'),
+        ('insert', '2024-01-02'),
+        ('delete', '2024-01-01'),
+        ('update', '2024-01-02'),
+        ('insert', '2024-01-03'),
+    ]
+    assert entries[2]['old'] == {'value': 1.5} and entries[2]['new'] is None
+    assert entries[3]['old'] == {'value': 2.0} and entries[3]['new'] == {'value': 2.5}
+    assert {e['series'] for e in entries} == {'series'}
+
+
+def test_formatting_only_difference_is_not_logged(collector):
+    path = os.path.join(collector.data_dir, 'series.csv')
+    with open(path, 'w') as f:
+        f.write('date,value\n2024-01-01,30\n')
+    collector._save_csv(frame([(date(2024, 1, 1), 30.0)]), path)
+
+    assert not os.path.exists(collector.changes_log)
+
+
+def test_non_finite_values_are_logged_as_null(collector):
+    path = os.path.join(collector.data_dir, 'series.csv')
+    collector._save_csv(frame([(date(2024, 1, 1), float('inf'))]), path)
+
+    assert read_log(collector)[0]['new'] == {'value': None}
+
+
+def test_seq_is_contiguous_across_instances(collector):
+    path = os.path.join(collector.data_dir, 'series.csv')
+    collector._save_csv(frame([(date(2024, 1, 1), 1), (date(2024, 1, 2), 2)]), path)
+
+    second = DataCollector()
+    second._save_csv(frame([(date(2024, 1, 1), 1), (date(2024, 1, 2), 2), (date(2024, 1, 3), 3)]), path)
+
+    assert [e['seq'] for e in read_log(second)] == [1, 2, 3]
+
+
+def test_drops_interrupted_last_line(collector):
+    with open(collector.changes_log, 'w') as f:
+        f.write('{"seq": 1}\n{"seq": 2}\n{"seq": 3, "ru')
+
+    path = os.path.join(collector.data_dir, 'series.csv')
+    collector._save_csv(frame([(date(2024, 1, 1), 1)]), path)
+
+    assert [e['seq'] for e in read_log(collector)] == [1, 2, 3]
+
+
+def test_keeps_complete_last_line_missing_newline(collector):
+    with open(collector.changes_log, 'w') as f:
+        f.write('{"seq": 1}\n{"seq": 2}')
+
+    path = os.path.join(collector.data_dir, 'series.csv')
+    collector._save_csv(frame([(date(2024, 1, 1), 1)]), path)
+
+    assert [e['seq'] for e in read_log(collector)] == [1, 2, 3]
+
+
+def test_invalid_line_before_end_raises_without_truncating(collector):
+    content = '{"seq": 1}\n<<<<<<< HEAD\n{"seq": 2}\n=======\n{"seq": 2}\n>>>>>>> main\n{"seq": 3}\n'
+    with open(collector.changes_log, 'w') as f:
+        f.write(content)
+
+    path = os.path.join(collector.data_dir, 'series.csv')
+    with pytest.raises(ValueError):
+        collector._save_csv(frame([(date(2024, 1, 1), 1)]), path)
+
+    with open(collector.changes_log) as f:
+        assert f.read() == content
+
+
+def test_constructor_does_not_touch_log(collector):
+    with open(collector.changes_log, 'w') as f:
+        f.write('{"seq": 1}\n{"seq": 2, "ru')
+
+    DataCollector()
+
+    with open(collector.changes_log) as f:
+        assert f.read() == '{"seq": 1}\n{"seq": 2, "ru'